@@ -13,8 +13,6 @@ import functools
 import sys
 
 from clik import args as clik_args, parser as clik_parser
-from clik.compat import iteritems
-from clik.util import AttributeDict
 from wtforms import \
     DateField as DateFieldBase, \
     DateTimeField as DateTimeFieldBase, \
@@ -218,11 +216,13 @@ class SelectField(SelectFieldBase):
             choices = [(choice, choice) for choice in choices]
         if validators is None:
             validators = []
+        has_optional = False
         for validator in validators:
             if isinstance(validator, InputRequired):
                 break
+            has_optional = has_optional or isinstance(validator, Optional)
         else:
-            if not any(isinstance(v, Optional) for v in validators):
+            if not has_optional:
                 validators.append(Optional())
         super_init = super(SelectField, self).__init__
         super_init(choices=choices, validators=validators, **kwargs)
@@ -346,6 +346,71 @@ SELECT_TYPES = (SelectField, SelectFieldBase, SelectMultipleField,
 #: :type: :func:`tuple`
 SIMPLE_TYPES = DATETIME_TYPES + PRIMITIVE_TYPES + SELECT_TYPES
 
+#: Flag indicating a field is a :class:`FieldList`.
+#:
+#: :type: :class:`int`
+IS_FIELDLIST = 1 << 0
+
+#: Flag indicating a field is a :class:`wtforms.fields.FormField`.
+#:
+#: :type: :class:`int`
+IS_FORMFIELD = 1 << 1
+
+#: Flag indicating a field is one of :data:`DATETIME_TYPES`.
+#:
+#: :type: :class:`int`
+IS_DATETIME = 1 << 2
+
+#: Flag indicating a field is one of :data:`MULTIPLE_VALUE_TYPES`.
+#:
+#: :type: :class:`int`
+IS_MULTIPLE_VALUE = 1 << 3
+
+
+def _build_base_flags():
+    """Return the mapping used to initialize :data:`_BASE_FLAGS`."""
+    rv = {FieldList: IS_FIELDLIST, FormField: IS_FORMFIELD}
+    for types, flag in ((DATETIME_TYPES, IS_DATETIME),
+                        (MULTIPLE_VALUE_TYPES, IS_MULTIPLE_VALUE)):
+        for cls in types:
+            rv[cls] = rv.get(cls, 0) | flag
+    return rv
+
+
+#: Maps each of the types above to the flags it contributes. Consulted
+#: (via the MRO) by :func:`_flags_for`.
+#:
+#: :type: :class:`dict` mapping ``type -> int``
+_BASE_FLAGS = _build_base_flags()
+
+#: Cache of computed flags for concrete field classes, populated lazily
+#: by :func:`_flags_for`.
+#:
+#: :type: :class:`dict` mapping ``type -> int``
+_FIELD_FLAGS = {}
+
+
+def _flags_for(cls):
+    """
+    Return the ``IS_*`` flags for field class ``cls``.
+
+    This is equivalent to (but much cheaper than) running ``isinstance``
+    checks against the corresponding types. The MRO is walked
+    once per class, after which the result is a single dictionary lookup.
+
+    :param type cls: Field class
+    :return: Bitwise OR of the applicable ``IS_*`` flags
+    :rtype: :class:`int`
+    """
+    try:
+        return _FIELD_FLAGS[cls]
+    except KeyError:
+        flags = 0
+        for base in cls.__mro__:
+            flags |= _BASE_FLAGS.get(base, 0)
+        _FIELD_FLAGS[cls] = flags
+        return flags
+
 
 def default(fn, parser_help_value):
     """
@@ -395,6 +460,28 @@ def stringify(value):
     return rv
 
 
+def _add_notes(text, notes):
+    """
+    Return ``text`` with each of ``notes`` appended in parentheses.
+
+    If ``text`` is empty, the first note takes its place (without the
+    parentheses). The result is built with a single join rather than by
+    repeatedly concatenating to ``text``.
+
+    :param text: Help text, may be empty or ``None``
+    :type text: :class:`str` or ``None``
+    :param notes: Notes to append
+    :type notes: Sequence of :class:`str`
+    :return: Help text with notes
+    :rtype: :class:`str` or ``None``
+    """
+    if not notes:
+        return text
+    if not text:
+        text, notes = notes[0], notes[1:]
+    return '%s%s' % (text, ''.join([' (%s)' % note for note in notes]))
+
+
 class FormError(Exception):
     """Error type for exceptions raised from this module."""
 
@@ -402,6 +489,8 @@ class FormError(Exception):
 class Multidict(dict):
     """Just enough multidict to make WTForms happy."""
 
+    __slots__ = ()
+
     def __getitem__(self, key):
         """Return value for ``key``, or first item if value is list."""
         value = dict.__getitem__(self, key)
@@ -421,6 +510,195 @@ class Multidict(dict):
             return [value]
         return value
 
+    def setlist(self, key, values):
+        """Set list ``values`` for ``key``."""
+        dict.__setitem__(self, key, values)
+
+
+# =============================================================================
+# ----- Mappers ---------------------------------------------------------------
+# =============================================================================
+
+#: Maps field types to functions ("mappers") that translate fields of that
+#: type into arguments for :meth:`argparse.ArgumentParser.add_argument`.
+#: Populated by :func:`mapper`. Use :func:`mapper` and
+#: :func:`unregister_mapper` rather than modifying it directly, so that
+#: the resolved mappers cached for field subclasses stay in sync.
+#:
+#: :type: :class:`dict` mapping ``type -> fn``
+mappers = {}
+
+#: Field attributes that mappers (and :meth:`Form.configure_parser`) read
+#: when computing the arguments for a field. The computed arguments are
+#: cached per form class and recomputed if any of these differ, since they
+#: may be changed on individual form instances.
+#:
+#: :type: :func:`tuple` of :class:`str`
+SPEC_ATTRIBUTES = ('choices', 'description', 'format', 'metavar')
+
+#: Cache of resolved mappers for concrete field classes, populated lazily
+#: by :func:`_mapper_for`.
+#:
+#: :type: :class:`dict` mapping ``type -> fn``
+_MAPPER_CACHE = {}
+
+
+def mapper(*types):
+    """
+    Register the decorated function as the mapper for field ``types``.
+
+    A mapper is called with the field being configured, the dictionary of
+    keyword arguments for :meth:`argparse.ArgumentParser.add_argument`, and
+    a list of notes to be appended (parenthesized) to the help message. It
+    updates the keyword arguments and notes in place and returns a boolean
+    indicating whether the field's default value should be noted in the
+    help message::
+
+        @mapper(MyField)
+        def map_my_field(field, kwargs, notes):
+            kwargs['metavar'] = 'THING'
+            notes.append('must be a thing')
+            return True
+
+    Mappers apply to subclasses of the registered types, unless the
+    subclass has a mapper of its own.
+
+    The results are cached per form class and field, and recomputed only
+    when the field's mapper or one of the field attributes in
+    :data:`SPEC_ATTRIBUTES` changes, so mappers should not depend on other
+    per-instance field state.
+
+    Use :func:`unregister_mapper` to remove the mapper again.
+
+    :param types: Field types the mapper handles
+    :return: Decorator that registers the mapper and returns it unchanged
+    """
+    def decorator(fn):
+        for cls in types:
+            mappers[cls] = fn
+        _MAPPER_CACHE.clear()
+        return fn
+    return decorator
+
+
+def unregister_mapper(*types):
+    """
+    Remove the mappers registered for field ``types`` by :func:`mapper`.
+
+    Types that do not have a mapper registered are ignored. Fields of the
+    removed types fall back to the mapper of their closest base class, if
+    there is one, and are otherwise unsupported.
+
+    :param types: Field types whose mappers should be removed
+    """
+    for cls in types:
+        mappers.pop(cls, None)
+    _MAPPER_CACHE.clear()
+
+
+def _mapper_for(cls):
+    """
+    Return the mapper for field class ``cls``, or ``None`` if there is none.
+
+    The MRO is walked once per class, after which the result is a single
+    dictionary lookup.
+
+    :param type cls: Field class
+    :return: Mapper function or ``None``
+    """
+    try:
+        return _MAPPER_CACHE[cls]
+    except KeyError:
+        fn = None
+        for base in cls.__mro__:
+            fn = mappers.get(base)
+            if fn is not None:
+                break
+        _MAPPER_CACHE[cls] = fn
+        return fn
+
+
+@mapper(*PRIMITIVE_TYPES)
+def _map_primitive(field, kwargs, notes):
+    """Map primitive fields, which only need the metavar."""
+    if getattr(field, 'metavar', None) is not None:
+        kwargs['metavar'] = field.metavar
+    return True
+
+
+#: Cache of help notes for date/time formats, populated lazily by
+#: :func:`_map_datetime`.
+#:
+#: :type: :class:`dict` mapping ``str -> str``
+_DATETIME_NOTES = {}
+
+
+@mapper(*DATETIME_TYPES)
+def _map_datetime(field, kwargs, notes):
+    """Map date/time fields, noting the format and an example."""
+    _map_primitive(field, kwargs, notes)
+    try:
+        note = _DATETIME_NOTES[field.format]
+    except KeyError:
+        note_dt = EXAMPLE_DATETIME.strftime(field.format)
+        note_fmt = 'format: %s, example: %s'
+        note_args = (field.format, note_dt)
+        note = note_fmt % tuple(map(stringify, note_args))
+        note = _DATETIME_NOTES[field.format] = note.replace('%', '%%')
+    notes.append(note)
+    return True
+
+
+@mapper(SelectField, SelectFieldBase, SelectMultipleFieldBase)
+def _map_select(field, kwargs, notes):
+    """Map select fields, noting the choices."""
+    _map_primitive(field, kwargs, notes)
+    quoted = [stringify(value) for value, _ in field.choices]
+    notes.append('choices: %s' % ', '.join(quoted))
+    return True
+
+
+@mapper(SelectMultipleField)
+def _map_select_multiple(field, kwargs, notes):
+    """Map multiple select fields, which may be supplied multiple times."""
+    _map_select(field, kwargs, notes)
+    kwargs['action'] = 'append'
+    kwargs['default'] = []
+    # Defaults on multiple select fields
+    # don't seem to work.
+    # if default:
+    #     if callable(default):
+    #         val = 'dynamic'
+    #     else:
+    #         s = [stringify(v) for v in default]
+    #         val = ', '.join(s)
+    #     notes.append('default: %s' % val)
+    notes.append('may be supplied multiple times')
+    return False
+
+
+@mapper(FieldList)
+def _map_field_list(field, kwargs, notes):
+    """Map field lists, which may be supplied multiple times."""
+    kwargs['action'] = 'append'
+    kwargs['default'] = []
+    notes.append('may be supplied multiple times')
+    return False
+
+
+# I am not happy with this implementation, and I'm
+# not sure how to fix it.
+# @mapper(BooleanField)
+# def _map_boolean(field, kwargs, notes):
+#     val = default
+#     if callable(default):
+#         val = default()
+#     kwargs['default'] = val
+#     if val:
+#         kwargs['action'] = 'store_false'
+#     else:
+#         kwargs['action'] = 'store_true'
+
 
 # =============================================================================
 # ----- Form ------------------------------------------------------------------
@@ -455,9 +733,10 @@ class Form(FormBase):
     After the end-user arguments are obtained, they are "bound" to the
     form using :meth:`bind_args`. During the bind, the arguments are
     translated into a multidict that mimics what WTForms would get from an
-    HTML form, then the superclass constructor (:class:`wtforms.form.Form`) is
-    re-called with the multidict and the keyword arguments captured when the
-    form was initialized.
+    HTML form, then the already-bound fields are processed with the
+    multidict and the keyword arguments captured when the form was
+    initialized. (If ``meta`` overrides were supplied, the superclass
+    constructor is re-called instead, since they may affect field binding.)
 
     At that point the form can be validated, and behaves exactly as a stock
     WTForms form.
@@ -516,38 +795,145 @@ class Form(FormBase):
         """
         if 'formdata' in kwargs:
             del kwargs['formdata']
-        self._clik_constructor_kwargs = AttributeDict(
-            data=data,
-            kwargs=kwargs,
-            meta=meta,
-            obj=obj,
-            prefix=prefix,
-        )
+        self._clik_data = data
+        self._clik_kwargs = kwargs
+        self._clik_meta = meta
+        self._clik_obj = obj
+        self._clik_prefix = prefix
         super(Form, self).__init__(prefix=prefix)
         self._args = None
 
-    def _configure_parser(self, parser, exclude, root=False):
+    def _get_inverted_short_arguments(self):
         """
-        Super-spaghetti method that does the heavy lifting for parser config.
+        Return dictionary mapping field names to single-letter short arguments.
+
+        This merges :attr:`short_arguments` and :meth:`get_short_arguments`
+        and inverts the result. :meth:`get_short_arguments` is called every
+        time, since it may depend on the instance. When it returns nothing,
+        the inverted :attr:`short_arguments` is used, which is cached on the
+        class (and recomputed if :attr:`short_arguments` is reassigned).
+
+        :rtype: :class:`dict` mapping ``str -> char``
+        """
+        dynamic = self.get_short_arguments()
+        if dynamic:
+            short_args = dict(self.short_arguments or ())
+            short_args.update(dynamic)
+            return dict((v, k) for k, v in short_args.items())
+        cls = type(self)
+        cached = cls.__dict__.get('_clik_short_arguments_inverted')
+        if cached is None or cached[0] is not self.short_arguments:
+            short_args = self.short_arguments or {}
+            inverted = dict((v, k) for k, v in short_args.items())
+            cached = (self.short_arguments, inverted)
+            cls._clik_short_arguments_inverted = cached
+        return cached[1]
+
+    @classmethod
+    def _clik_class_cache(cls, attr):
+        """
+        Return the per-class cache dictionary stored at ``attr``.
+
+        Caches live directly on the class (they are not inherited by
+        subclasses) and are discarded whenever WTForms regenerates the
+        class's unbound fields, which happens when fields are added to or
+        removed from the class.
+
+        :param str attr: Name of the class attribute holding the cache
+        :return: Cache dictionary
+        :rtype: :class:`dict`
+        """
+        fields, cache = cls.__dict__.get(attr, (None, None))
+        if cache is None or fields is not cls._unbound_fields:
+            cache = {}
+            setattr(cls, attr, (cls._unbound_fields, cache))
+        return cache
+
+    @staticmethod
+    def _build_add_argument_spec(field, short_arg):
+        """
+        Compute the arguments to ``parser.add_argument`` for ``field``.
+
+        The returned spec depends only on the field's type, name and the
+        attributes in :data:`SPEC_ATTRIBUTES`, so it is cached by
+        :meth:`_get_argument_specs`. The one thing that depends on
+        the form instance -- the default value, which may come from the
+        ``obj`` or ``data`` passed to the constructor -- is not included in
+        the help message. Instead, the third item of the spec indicates
+        whether the caller should add a note about the default.
+
+        The type-specific work is done by the field's mapper (see
+        :func:`mapper`).
+
+        :param field: Field to compute the spec for
+        :type field: :class:`wtforms.fields.Field`
+        :param short_arg: Single-letter short argument, or ``None``
+        :type short_arg: :class:`str` or ``None``
+        :return: 3-tuple of ``(args, kwargs, handle_default)``
+        :rtype: :func:`tuple`
+        """
+        fn = _mapper_for(type(field))
+        if fn is None:
+            fmt = 'unsupported field type: %s'
+            raise FormError(fmt % type(field))
+        args = ()
+        if short_arg is not None:
+            args += ('-%s' % short_arg,)
+        args += ('--%s' % field.name.replace('_', '-'),)
+        kwargs = {}
+        notes = []
+        handle_default = fn(field, kwargs, notes)
+        kwargs['help'] = _add_notes(field.description, notes)
+        return args, kwargs, handle_default
+
+    def _get_default(self, field):
+        """
+        Return the default value for ``field``.
+
+        Mimics the way WTForms computes defaults. ``obj`` overrides
+        constructor ``kwargs``, which overrides ``data``, which overrides
+        the defaults set on fields.
+        """
+        ctor_data = self._clik_data
+        ctor_kwargs = self._clik_kwargs
+        ctor_obj = self._clik_obj
+        default = field.default
+        if ctor_obj and hasattr(ctor_obj, field.name):
+            default = getattr(ctor_obj, field.name)
+        elif field.name in ctor_kwargs:
+            default = ctor_kwargs[field.name]
+        elif ctor_data and field.name in ctor_data:
+            default = ctor_data[field.name]
+        return default
+
+    def _get_argument_specs(self, exclude, root=False):
+        """
+        Return the arguments to ``parser.add_argument`` for this form's fields.
+
+        The (instance-independent) bulk of the work is done by
+        :meth:`_build_add_argument_spec`, whose results are cached on the
+        form class, keyed by field name, short argument, field type and
+        mapper. Cached results are only reused if the field attributes
+        listed in :data:`SPEC_ATTRIBUTES` are unchanged, since those may be
+        changed on the instance (e.g. ``form.value.choices = ...``).
 
-        :param parser: Parser we are currently configuring
-        :type parser: :class:`clik.argparse.ArgumentParser`
         :param exclude: Sequence of field names which should not be configured
         :type exclude: Sequence or ``None``
         :param bool root: Whether this form instance is the root form (if
                           ``False``, this form is being configured because
                           it is a ``FormField`` of a parent form)
+        :return: List of ``(args, kwargs)`` tuples
+        :rtype: :class:`list`
         """
         # Only the top-level form can have short arguments. Any
         # subforms (by way of FormFields) will ignore short arguments.
         short_args = {}
         if root:
-            for value in (self.short_arguments, self.get_short_arguments()):
-                if value is not None:
-                    short_args.update(value)
-            short_args = dict((v, k) for k, v in iteritems(short_args))
+            short_args = self._get_inverted_short_arguments()
 
-        for field in self:
+        specs = []
+        cache = self._clik_class_cache('_clik_argspec_cache')
+        for field in self._fields.values():
             # Single-letter form fields would conflict with short
             # arguments.
             if len(field.name) == 1:
@@ -558,8 +944,9 @@ class Form(FormBase):
                 continue
 
             short_arg = short_args.get(field.name, None)
+            flags = _flags_for(type(field))
 
-            if isinstance(field, FormField):
+            if flags & IS_FORMFIELD:
                 # Form field is actually multiple fields, so there's
                 # not a neat mapping for a short argument.
                 if short_arg is not None:
@@ -567,105 +954,50 @@ class Form(FormBase):
                     raise FormError(msg)
 
                 # Recursively configure subforms.
-                field.form._configure_parser(parser, exclude)
-            else:
-                # Do a bunch of order-sensitive computation and
-                # manipulation of args and kwargs, then ultimately
-                # call parser.add_argument(*args, **kwargs).
-                args = ()
-                if short_arg is not None:
-                    args += ('-%s' % short_arg,)
-                args += ('--%s' % field.name.replace('_', '-'),)
-                kwargs = dict(help=field.description)
+                specs.extend(field.form._get_argument_specs(exclude))
+                continue
 
-                def add_to_help(note):
-                    if kwargs['help']:
-                        kwargs['help'] += ' (%s)' % note
-                    else:
-                        kwargs['help'] = note
-
-                if isinstance(field, FieldList):
-                    kwargs['action'] = 'append'
-                    kwargs['default'] = []
-                    add_to_help('may be supplied multiple times')
-                else:
-                    # Mimic the way WTForms computes defaults. ``obj``
-                    # overrides constructor ``kwargs``, which
-                    # overrides ``data``, which overrides the defaults
-                    # set on fields.
-                    ctor_data = self._clik_constructor_kwargs.data
-                    # ctor_kwargs = self._clik_constructor_kwargs.kwargs
-                    ctor_obj = self._clik_constructor_kwargs.obj
-                    default = field.default
-                    if ctor_obj and hasattr(ctor_obj, field.name):
-                        default = getattr(ctor_obj, field.name)
-                    # Overriding with plain ctor kwargs doesn't seem
-                    # to work.
-                    # elif field.name in ctor_kwargs:
-                    #     default = ctor_kwargs[field.name]
-                    elif ctor_data and field.name in ctor_data:
-                        default = ctor_data[field.name]
-
-                    if isinstance(field, SIMPLE_TYPES):
-                        if getattr(field, 'metavar', None) is not None:
-                            kwargs['metavar'] = field.metavar
-                        handle_default = True
-                        if isinstance(field, DATETIME_TYPES):
-                            note_dt = EXAMPLE_DATETIME.strftime(field.format)
-                            note_fmt = 'format: %s, example: %s'
-                            note_args = (field.format, note_dt)
-                            note = note_fmt % tuple(map(stringify, note_args))
-                            add_to_help(note.replace('%', '%%'))
-                            if default and not callable(default):
-                                handle_default = False
-                                string = default.strftime(field.format)
-                                add_to_help('default: %s' % stringify(string))
-                        if isinstance(field, SELECT_TYPES):
-                            choices = [value for value, _ in field.choices]
-                            quoted = [stringify(choice) for choice in choices]
-                            add_to_help('choices: %s' % ', '.join(quoted))
-                            if isinstance(field, SelectMultipleField):
-                                handle_default = False
-                                kwargs['action'] = 'append'
-                                kwargs['default'] = []
-                                # Defaults on multiple select fields
-                                # don't seem to work.
-                                # if default:
-                                #     if callable(default):
-                                #         val = 'dynamic'
-                                #     else:
-                                #         s = [stringify(v) for v in default]
-                                #         val = ', '.join(s)
-                                #     add_to_help('default: %s' % val)
-                                add_to_help('may be supplied multiple times')
-                        if handle_default:
-                            val = None
-                            if callable(default):
-                                val = 'dynamic'
-                                if hasattr(default, '__clik_wtf__'):
-                                    val = default.__clik_wtf__
-                                elif default in COMMON_DEFAULT_CALLABLES:
-                                    val = COMMON_DEFAULT_CALLABLES[default]
-                            elif default is not None:
-                                val = stringify(default)
-                            if val is not None:
-                                add_to_help('default: %s' % val)
-                    # I am not happy with this implementation, and I'm
-                    # not sure how to fix it.
-                    # elif isinstance(field, BooleanField):
-                    #     val = default
-                    #     if callable(default):
-                    #         val = default()
-                    #     kwargs['default'] = val
-                    #     if val:
-                    #         kwargs['action'] = 'store_false'
-                    #     else:
-                    #         kwargs['action'] = 'store_true'
+            state = tuple(getattr(field, a, None) for a in SPEC_ATTRIBUTES)
+            field_type = type(field)
+            key = (field.name, short_arg, field_type, _mapper_for(field_type))
+            spec = cache.get(key)
+            if spec is None or spec[0] != state:
+                spec = state, self._build_add_argument_spec(field, short_arg)
+                cache[key] = spec
+            args, kwargs, handle_default = spec[1]
+
+            if handle_default:
+                default = self._get_default(field)
+                val = None
+                if flags & IS_DATETIME and default and not callable(default):
+                    string = default.strftime(field.format)
+                    val = stringify(string)
+                elif callable(default):
+                    val = 'dynamic'
+                    if hasattr(default, '__clik_wtf__'):
+                        val = default.__clik_wtf__
                     else:
-                        fmt = 'unsupported field type: %s'
-                        raise FormError(fmt % type(field))
-
-                parser.add_argument(*args, **kwargs)
+                        # Keys are compared by equality, not identity:
+                        # builtin methods like datetime.date.today are
+                        # new objects on every attribute access.
+                        try:
+                            val = COMMON_DEFAULT_CALLABLES.get(default, val)
+                        except TypeError:  # unhashable callable
+                            pass
+                elif default is not None:
+                    val = stringify(default)
+                if val is not None:
+                    kwargs = kwargs.copy()
+                    note = 'default: %s' % val
+                    kwargs['help'] = _add_notes(kwargs['help'], (note,))
+
+            # The "append" action hands its default list to the caller,
+            # which may mutate it, so each parser needs a fresh one.
+            if kwargs.get('action') == 'append':
+                kwargs = dict(kwargs, default=[])
+
+            specs.append((args, kwargs))
+        return specs
 
     def configure_parser(self, parser=None, exclude=None):
         """
@@ -682,9 +1014,11 @@ class Form(FormBase):
             parser = clik_parser
         if exclude is None:  # pragma: no cover (obviously correct)
             exclude = ()
-        self._configure_parser(parser, exclude=exclude, root=True)
+        add_argument = parser.add_argument
+        for args, kwargs in self._get_argument_specs(exclude, root=True):
+            add_argument(*args, **kwargs)
 
-    def _populate_formdata(self, formdata, args, hyphens=()):
+    def _populate_formdata(self, formdata, args):
         """
         Translate argparse ``args`` into the WTForms multidict ``formdata``.
 
@@ -717,30 +1051,16 @@ class Form(FormBase):
 
             ccc-b_b_b-a_aa
 
-        Translating ``args`` into what WTForms wants is the heart of this
-        method, and relies on the ``hyphens`` argument. ``hyphens`` is a
-        tuple of integers representing indices of underscores that need to
-        be changed to hyphens.
+        That is simply the (full) name WTForms gave the field when the
+        subforms were bound, so the key is ``field.name`` and the attribute
+        on ``args`` is the name with the hyphens replaced by underscores.
 
-        For the root form (``ParentForm`` in the example above), ``hyphens``
-        starts out empty. All underscores are left as is when populating
-        the form data.
-
-        When the root form encounters a ``FormField``, it looks at the
-        length of the field name, adds 1, and appends that integer to the
-        ``hyphens`` tuple. It doesn't matter if the field name is ``"simple"``
-        or ``"more_complex_with_underscores"``, all we care is that the
-        character after that (which will be an underscore, to scope the
-        fields of the subform) is translated to a hyphen.
-
-        This process is done recursively for all child forms.
+        .. highlight:: python
 
         The other (less) tricky part is how WTForms handles ``FieldList``
         fields. For whatever reason, it wants them sort of pseudo-indexed
         in the keys of the formdata. (I'm not sure how else to describe it.)
 
-        .. highlight:: python
-
         For example, consider the form::
 
             class MyForm(Form):
@@ -757,35 +1077,51 @@ class Form(FormBase):
         we also translate values from ``FieldList`` fields into the
         appropriate structure inside formdata.
 
+        This process is done recursively for all child forms.
+
         :param Multidict formdata: Data object we are currently populating
         :param argparse.Namespace args: Arguments from the end user
-        :param tuple hyphens: Sequence of indices of underscores that must be
-                              replaced with hyphens in key names from ``args``
         """
-        for field in self:
-            if isinstance(field, FormField):
-                hyphen = (len(field.name) + 1,)
-                field.form._populate_formdata(formdata, args, hyphens + hyphen)
+        for field in self._fields.values():
+            flags = _flags_for(type(field))
+            if flags & IS_FORMFIELD:
+                field.form._populate_formdata(formdata, args)
             else:
-                key = field.name.replace('-', '_')
-                value = getattr(args, key)
+                key = field.name
+                value = getattr(args, key.replace('-', '_'))
                 if value is not None:
-                    for i in hyphens:
-                        key = '%s-%s' % (key[:i - 1], key[i:])
-                    if isinstance(field, FieldList):
+                    if flags & IS_FIELDLIST:
                         for i, item in enumerate(value):
                             formdata['%s-%i' % (key, i)] = item
+                    elif flags & IS_MULTIPLE_VALUE:
+                        formdata.setlist(key, value)
                     else:
                         formdata[key] = value
 
     def _bind_formdata(self, formdata, args):
-        """Recursively bind this form and its child forms."""
+        """
+        Recursively bind this form and its child forms.
+
+        The fields were already bound in :meth:`__init__`, so unless meta
+        overrides were supplied (which affect how fields are bound), only
+        the processing step of WTForms' initialization is run.
+        """
         self._args = args
-        kwargs = self._clik_constructor_kwargs.copy()
-        kwargs.update(dict(formdata=formdata))
-        super(Form, self).__init__(**kwargs)
-        for field in self:
-            if isinstance(field, FormField):
+        if self._clik_meta is None:
+            # Clear errors from any previous validation. FormField errors
+            # come from its subform, which is rebuilt by processing.
+            self._errors = None
+            for field in self._fields.values():
+                if not _flags_for(type(field)) & IS_FORMFIELD:
+                    field.errors = ()
+            kwargs = self._clik_kwargs
+            self.process(formdata, self._clik_obj, self._clik_data, **kwargs)
+        else:
+            super(Form, self).__init__(
+                formdata, self._clik_obj, self._clik_prefix, self._clik_data,
+                self._clik_meta, **self._clik_kwargs)
+        for field in self._fields.values():
+            if _flags_for(type(field)) & IS_FORMFIELD:
                 field.form._bind_formdata(formdata, args)
 
     def bind_args(self, args=None):
@@ -821,14 +1157,15 @@ class Form(FormBase):
         :param file: Stream to output to
         :type file: file-like object
         """
-        for field in self:
-            if isinstance(field, FormField):
+        for field in self._fields.values():
+            flags = _flags_for(type(field))
+            if flags & IS_FORMFIELD:
                 field.form.print_errors(file)
             else:
                 for error in field.errors:
                     error = error[0].lower() + error[1:]
                     msg = '%s: ' % field.name.replace('_', '-')
-                    if not isinstance(field, MULTIPLE_VALUE_TYPES):
+                    if not flags & IS_MULTIPLE_VALUE:
                         name = field.name.replace('-', '_')
                         msg += '%s: ' % getattr(self._args, name)
                     msg += error
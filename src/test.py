@@ -9,20 +9,23 @@ Tests for :mod:`clik_wtforms`.
 import datetime
 import decimal
 import io
+import re
 
 import pytest
 from clik.argparse import ArgumentParser
-from clik.util import AttributeDict
-from wtforms import SubmitField
+from wtforms import Field, SubmitField
 from wtforms.validators import InputRequired, Optional
 
 from clik_wtforms import DateField, DateTimeField, DecimalField, default, \
     FieldList, FloatField, Form, FormError, FormField, IntegerField, \
-    Multidict, SelectField, SelectMultipleField, StringField
+    mapper, mappers, Multidict, SelectField, SelectMultipleField, \
+    StringField, unregister_mapper
 
 
 class Argument(object):
-    """Represents argument data, as parsed from a ``--help`` message."""
+    """Represents argument data, as configured on the parser."""
+
+    __slots__ = ('help', 'metavar', 'name', 'short_name')
 
     def __init__(self, name):
         """
@@ -35,18 +38,36 @@ class Argument(object):
         self.name = name
         self.short_name = None
 
+    def assert_all(self, choices=None, datetime_format=None, default=None,
+                   example=None, multiple=False):
+        """
+        Assert several help message fragments in a single pass.
+
+        Each keyword adds the corresponding note (``choices: ...``,
+        ``format: ...``, ``default: ...``, ``example: ...`` or the "multiple
+        times" note) to the expected fragments. The fragments are combined
+        into a single regular expression so the help message is only scanned
+        once.
+        """
+        expected = []
+        if choices is not None:
+            expected.append('choices: %s' % choices)
+        if datetime_format is not None:
+            expected.append('format: %s' % datetime_format)
+        if default is not None:
+            expected.append('default: %s' % default)
+        if example is not None:
+            expected.append('example: %s' % example)
+        if multiple:
+            expected.append('may be supplied multiple times')
+        assert expected, 'assert_all() requires at least one keyword'
+        pattern = re.compile('|'.join(re.escape(text) for text in expected))
+        assert set(pattern.findall(self.help)) == set(expected)
+
     def assert_choices(self, choices):
         """Assert choices string is in help message."""
         self.assert_in_help('choices: %s' % choices)
 
-    def assert_datetime_example(self, example):
-        """Assert datetime example is in help message."""
-        self.assert_in_help('example: %s' % example)
-
-    def assert_datetime_format(self, format):
-        """Assert datetime format instructions are in help message."""
-        self.assert_in_help('format: %s' % format)
-
     def assert_default(self, value):
         """Assert default value is in help message."""
         self.assert_in_help('default: %s' % value)
@@ -68,13 +89,13 @@ class Argument(object):
         assert short_name == self.short_name
 
 
-class Harness(AttributeDict):
+class Harness(dict):
     """
     Test harness for clik-wtforms.
 
-    This "runs" the program with ``--help`` to get the configured arguments,
-    which are made available as the keys on the harness object. See
-    :class:`Argument` for how these are used.
+    This inspects the configured parser to get the arguments, which are
+    made available as the keys on the harness object. See :class:`Argument`
+    for how these are used.
 
     This can also simulate user input and the resulting form data via the
     :meth:`result_for`.
@@ -90,30 +111,60 @@ class Harness(AttributeDict):
         """
         self.form_class = form_class
         self.parser = ArgumentParser()
+        self._build_parser(**kwargs)
+        self._parse_actions()
+
+    @classmethod
+    def for_data(cls, form_class, **kwargs):
+        """
+        Return a harness that only supports :meth:`result_for`.
+
+        This skips populating the harness with arguments, for tests that only
+        care about the resulting form data.
+
+        :param type form_class: Form class under test
+        :param kwargs: Keyword arguments to pass to the form class constructor
+                       when configuring the parser
+        :rtype: :class:`Harness`
+        """
+        self = cls.__new__(cls)
+        self.form_class = form_class
+        self.parser = ArgumentParser()
+        self._build_parser(**kwargs)
+        return self
+
+    def _build_parser(self, **kwargs):
+        """Configure :attr:`parser` using an instance of the form class."""
         cpkwargs = {}
         if 'configure_parser_kwargs' in kwargs:
             cpkwargs = kwargs['configure_parser_kwargs']
             del kwargs['configure_parser_kwargs']
         self.form_class(**kwargs).configure_parser(self.parser, **cpkwargs)
 
-        current_arg = None
-        for line in self.parser.format_help().splitlines():
-            line = line.strip()
-            if line.startswith('-'):
-                bits = line.split('  ', 1)
-                arg_bits = bits[0].split(',')
-                long_arg_bits = arg_bits[-1].strip().split()
-                name = long_arg_bits[0][2:]
-                current_arg = Argument(name)
-                self[name] = current_arg
-                if len(arg_bits) > 1:
-                    current_arg.short_name = arg_bits[0].strip().split()[0][1:]
-                if len(long_arg_bits) > 1:
-                    current_arg.metavar = long_arg_bits[1]
-                if len(bits) > 1:
-                    current_arg.help += bits[1].strip()
-            elif current_arg:
-                current_arg.help += ' %s' % line
+    def _parse_actions(self):
+        """
+        Populate the harness with arguments from the parser's actions.
+
+        The metavar and help message are rendered using the parser's help
+        formatter, so they are exactly what ``--help`` would show, without
+        formatting (and then re-parsing) the entire help message.
+        """
+        formatter = self.parser._get_formatter()
+        for action in self.parser._actions:
+            long_opts = [o for o in action.option_strings if o[:2] == '--']
+            if not long_opts:
+                continue
+            current_arg = Argument(long_opts[0][2:])
+            self[current_arg.name] = current_arg
+            for option_string in action.option_strings:
+                if option_string[:2] != '--':
+                    current_arg.short_name = option_string[1:]
+            if action.nargs != 0:
+                default = formatter._get_default_metavar_for_optional(action)
+                metavar = formatter._format_args(action, default)
+                current_arg.metavar = metavar
+            if action.help:
+                current_arg.help = formatter._expand_help(action)
 
     def result_for(self, *argv, **kwargs):
         """
@@ -130,6 +181,29 @@ class Harness(AttributeDict):
         return form.data
 
 
+@pytest.fixture(scope='module')
+def make_harness():
+    """
+    Return a factory for :class:`Harness` objects.
+
+    Harnesses are cached by form class and keyword arguments, so tests that
+    exercise the same form with the same arguments share a harness. If the
+    keyword arguments are unhashable, a fresh harness is returned.
+    """
+    cache = {}
+
+    def make(form_class, **kwargs):
+        try:
+            key = (form_class, frozenset(kwargs.items()))
+            return cache[key]
+        except KeyError:
+            harness = cache[key] = Harness(form_class, **kwargs)
+            return harness
+        except TypeError:
+            return Harness(form_class, **kwargs)
+    return make
+
+
 def test_default_wrapper():
     """Check that default wrapper is transparent except __clik_wtf__."""
     def myfn():
@@ -194,13 +268,18 @@ def test_select_required():
         sm_req = SelectMultipleField(validators=[InputRequired()])
     form = MyForm()
 
+    def validator_types(field):
+        return set(cls for v in field.validators for cls in type(v).__mro__)
+
     def assert_optional(field):
-        assert any(isinstance(v, Optional) for v in field.validators)
-        assert not any(isinstance(v, InputRequired) for v in field.validators)
+        types = validator_types(field)
+        assert Optional in types
+        assert InputRequired not in types
 
     def assert_required(field):
-        assert not any(isinstance(v, Optional) for v in field.validators)
-        assert any(isinstance(v, InputRequired) for v in field.validators)
+        types = validator_types(field)
+        assert Optional not in types
+        assert InputRequired in types
 
     assert_optional(form.s_exp)
     assert_optional(form.s_opt)
@@ -220,8 +299,22 @@ def test_multidict():
     assert d.getlist('a') == ['foo']
     assert d.getlist('b') == ['bar', 'baz']
 
+    d.setlist('c', [])
+    assert d['c'] == []
+    assert d.getlist('c') == []
+
+    d['b'] = 'qux'
+    assert d['b'] == 'qux'
+    assert d.getlist('b') == ['qux']
+
+    del d['a']
+    assert 'a' not in d
 
-@pytest.mark.parametrize('field_type,default,default_str,value,value_str', [
+    assert not hasattr(d, '__dict__')
+
+
+#: Parameters for :func:`test_field_basics`.
+FIELD_BASICS_PARAMS = [
     (
         DateField,
         datetime.date(2016, 11, 27),
@@ -246,8 +339,16 @@ def test_multidict():
     (FloatField, 7.42, '7.42', 42.7, '42.7'),
     (IntegerField, 7, '7', 42, '42'),
     (StringField, 'foo', 'foo', 'bar', 'bar'),
-])
-def test_field_basics(field_type, default, default_str, value, value_str):
+]
+
+
+@pytest.mark.parametrize(
+    'field_type,default,default_str,value,value_str',
+    FIELD_BASICS_PARAMS,
+    ids=['date', 'datetime', 'decimal', 'float', 'int', 'str'],
+)
+def test_field_basics(field_type, default, default_str, value, value_str,
+                      make_harness):
     """Check basics for fields: defaults, descriptions, metavars."""
     class MyForm(Form):
         all = field_type(
@@ -260,7 +361,7 @@ def test_field_basics(field_type, default, default_str, value, value_str):
         val = field_type(default=default)
         var = field_type(metavar='FOO')
 
-    harness = Harness(MyForm)
+    harness = make_harness(MyForm)
 
     def assert_arg(name, default, text, metavar):
         assert name in harness
@@ -287,6 +388,31 @@ def test_field_basics(field_type, default, default_str, value, value_str):
     assert harness.result_for(*argv) == expected
 
 
+#: Parameters for :func:`test_datetime_fields`.
+DATETIME_FIELDS_PARAMS = [
+    (
+        DateField,
+        '%Y-%m-%d',
+        '2017-11-27',
+        '%Y%m%d',
+        '20171127',
+        datetime.date(2018, 7, 22),
+        '2018-07-22',
+        '20180722',
+    ),
+    (
+        DateTimeField,
+        '"%Y-%m-%d %H:%M:%S"',
+        '"2017-11-27 13:52:41"',
+        '%Y%m%d%H%M%S',
+        '20171127135241',
+        datetime.datetime(2018, 7, 22, 18, 16, 14),
+        '2018-07-22 18:16:14',
+        '20180722181614',
+    ),
+]
+
+
 @pytest.mark.parametrize(
     'field_type'
     ',default_format'
@@ -295,51 +421,33 @@ def test_field_basics(field_type, default, default_str, value, value_str):
     ',custom_example'
     ',value'
     ',default_string'
-    ',custom_string', [
-        (
-            DateField,
-            '%Y-%m-%d',
-            '2017-11-27',
-            '%Y%m%d',
-            '20171127',
-            datetime.date(2018, 7, 22),
-            '2018-07-22',
-            '20180722',
-        ),
-        (
-            DateTimeField,
-            '"%Y-%m-%d %H:%M:%S"',
-            '"2017-11-27 13:52:41"',
-            '%Y%m%d%H%M%S',
-            '20171127135241',
-            datetime.datetime(2018, 7, 22, 18, 16, 14),
-            '2018-07-22 18:16:14',
-            '20180722181614',
-        ),
-    ])
+    ',custom_string',
+    DATETIME_FIELDS_PARAMS,
+    ids=['date', 'datetime'],
+)
 def test_datetime_fields(field_type, default_format, default_example,
                          custom_format, custom_example, value, default_string,
-                         custom_string):
+                         custom_string, make_harness):
     """Check format handling for date/time based fields."""
     class MyForm(Form):
         custom = field_type(format=custom_format)
         default = field_type()
 
-    harness = Harness(MyForm)
+    harness = make_harness(MyForm)
 
     assert 'custom' in harness
-    harness.custom.assert_datetime_format(custom_format)
-    harness.custom.assert_datetime_example(custom_example)
+    harness['custom'].assert_all(datetime_format=custom_format,
+                                 example=custom_example)
 
     assert 'default' in harness
-    harness.default.assert_datetime_format(default_format)
-    harness.default.assert_datetime_example(default_example)
+    harness['default'].assert_all(datetime_format=default_format,
+                                  example=default_example)
 
     args = ('--custom', custom_string, '--default', default_string)
     assert harness.result_for(*args) == dict(custom=value, default=value)
 
 
-def test_select_fields():
+def test_select_fields(make_harness):
     """Check configuration and data handling for select fields."""
     choices = ('foo', 'bar', 'baz qux')
     choices_str = 'foo, bar, "baz qux"'
@@ -350,22 +458,19 @@ def test_select_fields():
         multiple = SelectMultipleField(choices=choices)
         single = SelectField(choices=choices)
 
-    harness = Harness(MyForm)
+    harness = make_harness(MyForm)
 
     assert 'default' in harness
-    harness.default.assert_choices(choices_str)
-    harness.default.assert_default('foo')
+    harness['default'].assert_all(choices=choices_str, default='foo')
 
     assert 'invalid' in harness
-    harness.invalid.assert_choices(choices_str)
-    harness.invalid.assert_default('foo')
+    harness['invalid'].assert_all(choices=choices_str, default='foo')
 
     assert 'multiple' in harness
-    harness.multiple.assert_choices(choices_str)
-    harness.multiple.assert_multiple()
+    harness['multiple'].assert_all(choices=choices_str, multiple=True)
 
     assert 'single' in harness
-    harness.single.assert_choices(choices_str)
+    harness['single'].assert_choices(choices_str)
 
     expected = dict(default='foo', invalid=None, multiple=[], single=None)
     assert harness.result_for() == expected
@@ -378,12 +483,45 @@ def test_select_fields():
     assert result['invalid'] is None
     assert 'multiple' in result
     assert isinstance(result['multiple'], list)
-    assert set(result['multiple']) == set(('foo', 'bar'))
+    assert sorted(result['multiple']) == ['bar', 'foo']
     assert 'single' in result
     assert result['single'] == 'bar'
 
 
-@pytest.mark.parametrize('field_type,value_strs,values', [
+def test_select_dynamic_choices():
+    """Check that field attributes changed on the instance reach the parser."""
+    class MyForm(Form):
+        value = SelectField(choices=('foo', 'bar'))
+        when = DateField(description='some date')
+
+    harness = Harness(MyForm)
+    harness['value'].assert_choices('foo, bar')
+    harness['value'].assert_metavar('VALUE')
+    harness['when'].assert_all(datetime_format='%Y-%m-%d')
+    harness['when'].assert_in_help('some date')
+
+    form = MyForm()
+    form.value.choices = [('baz', 'baz')]
+    form.value.description = 'a new description'
+    form.value.metavar = 'THING'
+    form.when.format = '%d/%m/%Y'
+    parser = ArgumentParser()
+    form.configure_parser(parser)
+    help = parser.format_help()
+    assert 'choices: baz' in help
+    assert 'a new description' in help
+    assert '--value THING' in help
+    assert 'format: %d/%m/%Y' in help
+
+    harness = Harness(MyForm)
+    harness['value'].assert_choices('foo, bar')
+    harness['value'].assert_metavar('VALUE')
+    harness['when'].assert_all(datetime_format='%Y-%m-%d')
+    assert 'a new description' not in harness['value'].help
+
+
+#: Parameters for :func:`test_field_list`.
+FIELD_LIST_PARAMS = [
     (
         DateField,
         ('2018-07-22', '2016-05-27'),
@@ -405,26 +543,110 @@ def test_select_fields():
     (FloatField, ('42.7', '7.42'), (42.7, 7.42)),
     (IntegerField, ('42', '7'), (42, 7)),
     (StringField, ('foo', 'bar'), ('foo', 'bar')),
-])
-def test_field_list(field_type, value_strs, values):
+]
+
+
+@pytest.mark.parametrize(
+    'field_type,value_strs,values',
+    FIELD_LIST_PARAMS,
+    ids=['date', 'datetime', 'decimal', 'float', 'int', 'str'],
+)
+def test_field_list(field_type, value_strs, values, make_harness):
     """Check behavior of field lists."""
     class MyForm(Form):
         value = FieldList(field_type())
 
-    harness = Harness(MyForm)
+    harness = make_harness(MyForm)
 
     assert 'value' in harness
-    harness.value.assert_multiple()
+    harness['value'].assert_multiple()
 
     assert harness.result_for() == dict(value=[])
 
-    args = []
-    for value_str in value_strs:
-        args.extend(('--value', value_str))
+    args = [arg for v in value_strs for arg in ('--value', v)]
     assert harness.result_for(*args) == dict(value=list(values))
 
 
-def test_form_field():
+def test_multiple_value_default_not_shared():
+    """Check that parsers do not share the default list of an argument."""
+    class MyForm(Form):
+        select = SelectMultipleField(choices=[('a', 'a')])
+        values = FieldList(StringField())
+
+    parser = ArgumentParser()
+    MyForm().configure_parser(parser)
+    args = parser.parse_args([])
+    args.select.append('leak')
+    args.values.append('leak')
+
+    parser = ArgumentParser()
+    MyForm().configure_parser(parser)
+    args = parser.parse_args([])
+    assert args.select == []
+    assert args.values == []
+
+
+#: Names of the subform fields on the parent form in :func:`test_form_field`.
+FORM_FIELD_PARENTS = ('xxx', 'y_yy', 'z_z_z')
+
+#: Names of the subform fields on the child form in :func:`test_form_field`.
+FORM_FIELD_CHILDREN = ('aaa', 'b_bb', 'c_c_c')
+
+#: Argument names for the leaf fields in :func:`test_form_field`, paired with
+#: the ``(parent, child)`` field names.
+FORM_FIELD_ARGUMENTS = [
+    ('%s-%s-value' % (p.replace('_', '-'), c.replace('_', '-')), (p, c))
+    for p in FORM_FIELD_PARENTS
+    for c in FORM_FIELD_CHILDREN
+]
+
+
+def form_field_data(value):
+    """
+    Return form data for :func:`test_form_field`.
+
+    :param value: Function that takes the parent and child field names and
+                  returns the value for that leaf field
+    :type value: ``fn(parent, child) -> value``
+    :return: Nested data dictionary, as returned by ``form.data``
+    :rtype: :class:`dict`
+    """
+    return dict(
+        (p, dict((c, dict(value=value(p, c))) for c in FORM_FIELD_CHILDREN))
+        for p in FORM_FIELD_PARENTS
+    )
+
+
+#: Expected data for :func:`test_form_field` when no arguments are given.
+FORM_FIELD_EMPTY = form_field_data(lambda p, c: None)
+
+#: Expected data for :func:`test_form_field` when all arguments are given.
+FORM_FIELD_FULL = form_field_data(lambda p, c: p[0] + c[0])
+
+
+class FormFieldGrandchildForm(Form):
+    """Innermost form for :func:`test_form_field`."""
+
+    value = StringField()
+
+
+class FormFieldChildForm(Form):
+    """Middle form for :func:`test_form_field`."""
+
+    aaa = FormField(FormFieldGrandchildForm)
+    b_bb = FormField(FormFieldGrandchildForm)
+    c_c_c = FormField(FormFieldGrandchildForm)
+
+
+class FormFieldParentForm(Form):
+    """Outermost form for :func:`test_form_field`."""
+
+    xxx = FormField(FormFieldChildForm)
+    y_yy = FormField(FormFieldChildForm)
+    z_z_z = FormField(FormFieldChildForm)
+
+
+def test_form_field(make_harness):
     """
     Very ugly test for form fields.
 
@@ -432,88 +654,65 @@ def test_form_field():
     and lots of underscores. The idea is to stress the form data translation
     bits of the code.
     """
-    class GrandchildForm(Form):
-        value = StringField()
+    harness = make_harness(FormFieldParentForm)
+    for name, _ in FORM_FIELD_ARGUMENTS:
+        assert name in harness
+
+    assert harness.result_for() == FORM_FIELD_EMPTY
 
+    args = [
+        arg
+        for name, (p, c) in FORM_FIELD_ARGUMENTS
+        for arg in ('--%s' % name, FORM_FIELD_FULL[p][c]['value'])
+    ]
+    assert harness.result_for(*args) == FORM_FIELD_FULL
+
+
+@pytest.mark.parametrize(
+    'name,parent,child',
+    [(name, p, c) for name, (p, c) in FORM_FIELD_ARGUMENTS],
+    ids=[name for name, _ in FORM_FIELD_ARGUMENTS],
+)
+def test_form_field_leaf(name, parent, child, make_harness):
+    """Check a single leaf of the :func:`test_form_field` form in isolation."""
+    harness = make_harness(FormFieldParentForm)
+    assert name in harness
+
+    value = FORM_FIELD_FULL[parent][child]['value']
+    expected = form_field_data(
+        lambda p, c: value if (p, c) == (parent, child) else None)
+    assert harness.result_for('--%s' % name, value) == expected
+
+
+def test_form_field_separator_and_prefix(make_harness):
+    """Check form data for prefixed forms and custom subform separators."""
     class ChildForm(Form):
-        aaa = FormField(GrandchildForm)
-        b_bb = FormField(GrandchildForm)
-        c_c_c = FormField(GrandchildForm)
+        value = StringField()
 
     class ParentForm(Form):
-        xxx = FormField(ChildForm)
-        y_yy = FormField(ChildForm)
-        z_z_z = FormField(ChildForm)
-
-    harness = Harness(ParentForm)
-    assert 'xxx-aaa-value' in harness
-    assert 'xxx-b-bb-value' in harness
-    assert 'xxx-c-c-c-value' in harness
-    assert 'y-yy-aaa-value' in harness
-    assert 'y-yy-b-bb-value' in harness
-    assert 'y-yy-c-c-c-value' in harness
-    assert 'z-z-z-aaa-value' in harness
-    assert 'z-z-z-b-bb-value' in harness
-    assert 'z-z-z-c-c-c-value' in harness
-
-    assert harness.result_for() == dict(
-        xxx=dict(
-            aaa=dict(value=None),
-            b_bb=dict(value=None),
-            c_c_c=dict(value=None),
-        ),
-        y_yy=dict(
-            aaa=dict(value=None),
-            b_bb=dict(value=None),
-            c_c_c=dict(value=None),
-        ),
-        z_z_z=dict(
-            aaa=dict(value=None),
-            b_bb=dict(value=None),
-            c_c_c=dict(value=None),
-        ),
-    )
+        child = FormField(ChildForm, separator='_')
+        other = StringField()
 
-    args = (
-        '--xxx-aaa-value', 'xa',
-        '--xxx-b-bb-value', 'xb',
-        '--xxx-c-c-c-value', 'xc',
-        '--y-yy-aaa-value', 'ya',
-        '--y-yy-b-bb-value', 'yb',
-        '--y-yy-c-c-c-value', 'yc',
-        '--z-z-z-aaa-value', 'za',
-        '--z-z-z-b-bb-value', 'zb',
-        '--z-z-z-c-c-c-value', 'zc',
-    )
-    assert harness.result_for(*args) == dict(
-        xxx=dict(
-            aaa=dict(value='xa'),
-            b_bb=dict(value='xb'),
-            c_c_c=dict(value='xc'),
-        ),
-        y_yy=dict(
-            aaa=dict(value='ya'),
-            b_bb=dict(value='yb'),
-            c_c_c=dict(value='yc'),
-        ),
-        z_z_z=dict(
-            aaa=dict(value='za'),
-            b_bb=dict(value='zb'),
-            c_c_c=dict(value='zc'),
-        ),
-    )
+    harness = make_harness(ParentForm, prefix='pre')
+    assert 'pre-child-value' in harness
+    assert 'pre-other' in harness
+
+    args = ('--pre-child-value', 'foo', '--pre-other', 'bar')
+    expected = dict(child=dict(value='foo'), other='bar')
+    assert harness.result_for(*args, prefix='pre') == expected
 
 
-def test_exclude_fields():
+def test_exclude_fields(make_harness):
     """Check that excluded fields are not configured in the parser."""
     class MyForm(Form):
         value = StringField()
 
-    harness = Harness(MyForm, configure_parser_kwargs=dict(exclude=['value']))
+    cpkwargs = dict(exclude=['value'])
+    harness = make_harness(MyForm, configure_parser_kwargs=cpkwargs)
     assert 'value' not in harness
 
 
-def test_defaults():
+def test_defaults(make_harness):
     """Check that defaults handling and precedence works as expected."""
     class MyForm(Form):
         value = StringField()
@@ -522,51 +721,61 @@ def test_defaults():
         value = 'foo'
 
     obj = Object()
-    # kwargs = dict(value='bar')
+    kwargs = dict(value='bar')
     data = dict(value='baz')
 
     def assert_default(default, **kwargs):
-        harness = Harness(MyForm, **kwargs)
+        harness = make_harness(MyForm, **kwargs)
         assert 'value' in harness
-        harness.value.assert_default(default)
+        harness['value'].assert_default(default)
 
     assert_default('foo', obj=obj)
-    # assert_default('bar', **kwargs)
+    assert_default('bar', **kwargs)
     assert_default('baz', data=data)
 
-    # assert_default('foo', obj=obj, **kwargs)
+    assert_default('foo', obj=obj, **kwargs)
     assert_default('foo', obj=obj, data=data)
-    # assert_default('bar', data=data, **kwargs)
+    assert_default('bar', data=data, **kwargs)
 
-    # assert_default('foo', obj=obj, data=data, **kwargs)
+    assert_default('foo', obj=obj, data=data, **kwargs)
 
-    harness = Harness(MyForm)
+    harness = Harness.for_data(MyForm)
     assert harness.result_for() == dict(value=None)
     assert harness.result_for(obj=obj) == dict(value='foo')
-    # assert harness.result_for(**kwargs) == dict(value='bar')
+    assert harness.result_for(**kwargs) == dict(value='bar')
     assert harness.result_for(data=data) == dict(value='baz')
 
 
-def test_callable_default():
+def test_callable_default(make_harness):
     """Check default value help output for callable defaults."""
+    class UnhashableCallable(object):
+        __hash__ = None
+
+        def __call__(self):
+            return 'baz'
+
     class MyForm(Form):
         common = DateTimeField(default=datetime.datetime.today)
         specified = StringField(default=default(lambda: 'bar', 'always bar'))
+        unhashable = StringField(default=UnhashableCallable())
         unknown = StringField(default=lambda: 'foo')
 
-    harness = Harness(MyForm)
+    harness = make_harness(MyForm)
 
     assert 'common' in harness
-    harness.common.assert_default('now')
+    harness['common'].assert_default('now')
 
     assert 'specified' in harness
-    harness.specified.assert_default('always bar')
+    harness['specified'].assert_default('always bar')
+
+    assert 'unhashable' in harness
+    harness['unhashable'].assert_default('dynamic')
 
     assert 'unknown' in harness
-    harness.unknown.assert_default('dynamic')
+    harness['unknown'].assert_default('dynamic')
 
 
-def test_short_arguments():
+def test_short_arguments(make_harness):
     """Check that short arguments are merged and assigned correctly."""
     class MyForm(Form):
         short_arguments = dict(a='alpha', b='bravo', c='echo')
@@ -580,7 +789,7 @@ def test_short_arguments():
         charlie = StringField()
         delta = StringField()
 
-    harness = Harness(MyForm)
+    harness = make_harness(MyForm)
     for name in ('alpha', 'bravo', 'charlie', 'delta'):
         assert name in harness
         harness[name].assert_short_name(name[0])
@@ -593,7 +802,40 @@ def test_short_arguments():
     assert harness.result_for(*args) == expected
 
 
-def test_short_argument_form_field():
+def test_short_arguments_reassigned():
+    """Check that reassigning short arguments on the class takes effect."""
+    class MyForm(Form):
+        short_arguments = dict(a='alpha')
+        alpha = StringField()
+
+    Harness(MyForm)['alpha'].assert_short_name('a')
+    MyForm.short_arguments = dict(x='alpha')
+    Harness(MyForm)['alpha'].assert_short_name('x')
+
+
+def test_short_arguments_dynamic():
+    """Check that get_short_arguments is consulted for every form."""
+    class MyForm(Form):
+        def __init__(self, short, **kwargs):
+            super(MyForm, self).__init__(**kwargs)
+            self.short = short
+
+        def get_short_arguments(self):
+            return {self.short[0]: self.short}
+
+        alpha = StringField()
+        beta = StringField()
+
+    harness = Harness(MyForm, short='alpha')
+    harness['alpha'].assert_short_name('a')
+    harness['beta'].assert_short_name(None)
+
+    harness = Harness(MyForm, short='beta')
+    harness['alpha'].assert_short_name(None)
+    harness['beta'].assert_short_name('b')
+
+
+def test_short_argument_form_field(make_harness):
     """Check that short arguments cannot be assigned to a ``FormField``."""
     class ChildForm(Form):
         value = StringField()
@@ -603,34 +845,114 @@ def test_short_argument_form_field():
         child = FormField(ChildForm)
 
     with pytest.raises(FormError) as ei:
-        Harness(ParentForm)
+        make_harness(ParentForm)
     e = ei.value
     assert 'cannot assign a short argument to a FormField' in str(e)
 
 
-def test_single_character_field_name():
+def test_single_character_field_name(make_harness):
     """Check that single-character field names are disallowed."""
     class MyForm(Form):
         a = StringField()
 
     with pytest.raises(FormError) as ei:
-        Harness(MyForm)
+        make_harness(MyForm)
     e = ei.value
     assert 'field names must be at least two characters' in str(e)
 
 
-def test_unsupported_field_type():
+def test_unsupported_field_type(make_harness):
     """Check that using an unsupported field type raises an exception."""
     class MyForm(Form):
         submit = SubmitField()
 
     with pytest.raises(FormError) as ei:
-        Harness(MyForm)
+        make_harness(MyForm)
     e = ei.value
     assert 'unsupported field type' in str(e)
     assert 'wtforms.fields.simple.SubmitField' in str(e)
 
 
+class ThingField(Field):
+    """Custom field type used by :func:`test_mapper`."""
+
+    def process_formdata(self, valuelist):
+        """Prefix the value with ``thing:``."""
+        if valuelist:
+            self.data = 'thing: %s' % valuelist[0]
+
+
+@pytest.fixture
+def thing_mapper():
+    """Register a mapper for :class:`ThingField` for the duration of a test."""
+    @mapper(ThingField)
+    def map_thing(field, kwargs, notes):
+        kwargs['metavar'] = 'THING'
+        notes.append('must be a thing')
+        return False
+    yield map_thing
+    unregister_mapper(ThingField)
+    assert ThingField not in mappers
+
+
+def test_mapper(make_harness, thing_mapper):
+    """Check mapper dispatch for field subclasses and custom mappers."""
+    class UpperField(StringField):
+        def process_formdata(self, valuelist):
+            if valuelist:
+                self.data = valuelist[0].upper()
+
+    class MyForm(Form):
+        thing = ThingField(default='foo')
+        upper = UpperField(default='bar', metavar='UP')
+
+    harness = make_harness(MyForm)
+
+    assert 'thing' in harness
+    harness['thing'].assert_metavar('THING')
+    harness['thing'].assert_in_help('must be a thing')
+    assert 'default' not in harness['thing'].help
+
+    assert 'upper' in harness
+    harness['upper'].assert_metavar('UP')
+    harness['upper'].assert_default('bar')
+
+    args = ('--thing', 'baz', '--upper', 'qux')
+    assert harness.result_for(*args) == dict(thing='thing: baz', upper='QUX')
+
+
+def test_unregister_mapper():
+    """Check that removing a mapper applies to already-configured forms."""
+    class LoudField(StringField):
+        pass
+
+    class OddField(Field):
+        pass
+
+    @mapper(LoudField, OddField)
+    def map_loud(field, kwargs, notes):
+        kwargs['metavar'] = 'NOISE'
+        return False
+
+    class MyForm(Form):
+        loud = LoudField()
+
+    class OddForm(Form):
+        odd = OddField()
+
+    Harness(MyForm)['loud'].assert_metavar('NOISE')
+    Harness(OddForm)['odd'].assert_metavar('NOISE')
+
+    unregister_mapper(LoudField, OddField)
+    assert LoudField not in mappers
+    assert OddField not in mappers
+
+    Harness(MyForm)['loud'].assert_metavar('LOUD')
+    with pytest.raises(FormError) as ei:
+        Harness(OddForm)
+    assert 'unsupported field type' in str(ei.value)
+
+
 def test_print_errors():
     """Check the output of :meth:`clik_wtforms.Form.print_errors`."""
     class ChildForm(Form):
@@ -658,3 +980,72 @@ def test_print_errors():
         'number: baz: not a valid integer value',
     )
     assert string_io.getvalue() == '%s\n' % '\n'.join(expected_lines)
+
+
+@pytest.mark.parametrize('meta', [None, dict(locales=False)],
+                         ids=['default', 'meta'])
+def test_rebind(meta):
+    """Check that binding a form again replaces its data and errors."""
+    class MyForm(Form):
+        number = IntegerField()
+        value = StringField()
+
+    parser = ArgumentParser()
+    form = MyForm(meta=meta)
+    form.configure_parser(parser)
+
+    assert not form.bind_and_validate(parser.parse_args(('--number', 'x')))
+    assert 'number' in form.errors
+
+    form.bind_args(parser.parse_args(('--number', '1', '--value', 'foo')))
+    assert form.errors == {}
+    assert form.validate()
+    assert form.data == dict(number=1, value='foo')
+
+
+def test_bind_follows_instance_fields():
+    """Check that removing a field from one form doesn't affect others."""
+    class MyForm(Form):
+        drop = StringField()
+        keep = StringField()
+
+    full_parser = ArgumentParser()
+    MyForm().configure_parser(full_parser)
+    args = full_parser.parse_args(('--drop', 'a', '--keep', 'b'))
+    form = MyForm()
+    assert form.bind_and_validate(args)
+    assert form.data == dict(drop='a', keep='b')
+
+    partial_parser = ArgumentParser()
+    form = MyForm()
+    del form.drop
+    form.configure_parser(partial_parser)
+    assert form.bind_and_validate(partial_parser.parse_args(('--keep', 'c')))
+    assert form.data == dict(keep='c')
+
+    form = MyForm()
+    del form.drop
+    assert form.bind_and_validate(args)
+    assert form.data == dict(keep='b')
+
+    form = MyForm()
+    assert form.bind_and_validate(args)
+    assert form.data == dict(drop='a', keep='b')
+
+
+def test_bind_follows_subform_class():
+    """Check that fields added to a subform class after use are bound."""
+    class ChildForm(Form):
+        aa = StringField()
+
+    class ParentForm(Form):
+        child = FormField(ChildForm)
+
+    harness = Harness.for_data(ParentForm)
+    expected = dict(child=dict(aa='x'))
+    assert harness.result_for('--child-aa', 'x') == expected
+
+    ChildForm.bb = StringField()
+    harness = Harness.for_data(ParentForm)
+    args = ('--child-aa', 'x', '--child-bb', 'y')
+    assert harness.result_for(*args) == dict(child=dict(aa='x', bb='y'))